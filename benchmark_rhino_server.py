@@ -0,0 +1,663 @@
+"""
+Headless Benchmark for the Rhino HTTP Server
+Measures startup time and per-request overhead of phase2_rhino_http_server_FIXED.py
+without Rhino
+
+rhinoscriptsyntax, Rhino and System are replaced by minimal stubs, so the
+numbers show the cost of the server itself (HTTP, JSON, console output,
+admission control, result shaping, mesh caching) and not of Rhino's
+geometry kernel; meshing sleeps --tessellation-ms per object instead.
+
+The MCP-side checks (large create_boxes under the default rate limits,
+sharded scene generation over 1/2/4 worker processes) also drive
+phase3_rhino_mcp_server.py against the stub servers; they need the MCP
+server's packages (pip install mcp fastmcp requests) and are skipped
+without them. For sharding, each stub server sleeps --object-cost-ms per
+object to stand in for the geometry kernel of its own Rhino instance.
+
+INSTRUCTIONS FOR USE:
+1. Run (plain Python 3):
+   python benchmark_rhino_server.py
+2. Optional: --requests 500 (per measurement) --objects 10000 (batch size
+   for the result mode and atomic batch benchmarks)
+   --mesh-objects 1000 --tessellation-ms 1.0 (mesh cache benchmark)
+   --flood-boxes 40000 (create_boxes size under default limits)
+   --shard-objects 4000 --object-cost-ms 0.5 (sharding benchmark)
+
+Author: Olaf Olden
+Date: 2026-10-19
+"""
+
+import argparse
+import http.client
+import json
+import os
+import re
+import subprocess
+import sys
+import threading
+import time
+import types
+import uuid
+from contextlib import redirect_stdout
+
+
+class Stub:
+    """Stands in for any Rhino API object: every attribute, call and += returns itself"""
+
+    def __getattr__(self, name):
+        return self
+
+    def __call__(self, *args, **kwargs):
+        return self
+
+    def __iadd__(self, other):
+        return self
+
+    def __isub__(self, other):
+        return self
+
+
+class StubGeometry:
+    """Geometry with a fixed unit bounding box"""
+
+    def GetBoundingBox(self, accurate):
+        corner = types.SimpleNamespace(X=0.0, Y=0.0, Z=0.0)
+        return types.SimpleNamespace(Min=corner, Max=types.SimpleNamespace(X=1.0, Y=1.0, Z=1.0))
+
+
+class StubObjectTable(list):
+    """File3dm object table: a list of objects with a Geometry attribute"""
+
+    def Add(self, geometry, attributes=None):
+        self.append(types.SimpleNamespace(Geometry=geometry))
+
+
+class StubFile3dm:
+    """Rhino.FileIO.File3dm stand-in that stores the object count in a real file"""
+
+    def __init__(self):
+        self.Objects = StubObjectTable()
+
+    @staticmethod
+    def Read(path):
+        try:
+            with open(path) as f:
+                count = json.load(f)["objects"]
+        except (IOError, ValueError):
+            return None
+        model = StubFile3dm()
+        for _ in range(count):
+            model.Objects.Add(StubGeometry())
+        return model
+
+    def Write(self, path, version):
+        with open(path, "w") as f:
+            json.dump({"objects": len(self.Objects)}, f)
+        return True
+
+    def Dispose(self):
+        pass
+
+
+class StubList(list):
+    """System.Collections.Generic.List[T] and mesh vertex/face list stand-in"""
+
+    def __class_getitem__(cls, item_type):
+        return cls
+
+    def Add(self, item):
+        self.append(item)
+
+    @property
+    def Count(self):
+        return len(self)
+
+
+class StubMesh:
+    """
+    Rhino.Geometry.Mesh stand-in; CreateFromBrep sleeps tessellation_ms to
+    stand in for meshing a box (24 vertices, 6 quads)
+    """
+
+    tessellation_ms = 0.0
+
+    def __init__(self, vertex_count=0, face_count=0):
+        self.Vertices = StubList(
+            types.SimpleNamespace(X=0.0, Y=0.0, Z=0.0) for _ in range(vertex_count)
+        )
+        self.Faces = StubList(
+            types.SimpleNamespace(A=0, B=1, C=2, D=3, IsQuad=True) for _ in range(face_count)
+        )
+
+    @staticmethod
+    def CreateFromBrep(brep, parameters):
+        time.sleep(StubMesh.tessellation_ms / 1000.0)
+        return [StubMesh(24, 6)]
+
+    def Append(self, other):
+        self.Vertices.extend(other.Vertices)
+        self.Faces.extend(other.Faces)
+
+    def DuplicateMesh(self):
+        duplicate = StubMesh()
+        duplicate.Append(self)
+        return duplicate
+
+
+class StubRhinoObject:
+    """Document object; Rhino gives a modified object a new RuntimeSerialNumber"""
+
+    def __init__(self, object_id):
+        self.Id = object_id
+        self.RuntimeSerialNumber = 1
+        self.Geometry = StubGeometry()
+
+
+# GUID string -> StubRhinoObject for every object the stubs created
+document_objects = {}
+
+
+class StubDocument:
+    """Rhino.RhinoDoc.ActiveDoc stand-in: undo records and an object table"""
+
+    def __init__(self):
+        self.Objects = types.SimpleNamespace(
+            Add=lambda geometry: uuid.uuid4(),
+            Delete=lambda object_ids, quiet: len(object_ids)
+        )
+
+    def BeginUndoRecord(self, description):
+        return 1
+
+    def EndUndoRecord(self, serial):
+        return True
+
+
+def install_stub_modules(object_cost_ms=0.0, tessellation_ms=0.0):
+    """
+    Register stub rhinoscriptsyntax, Rhino and System modules
+
+    Args:
+        object_cost_ms (float): Simulated geometry kernel time per created object
+        tessellation_ms (float): Simulated meshing time per object
+    """
+    def add_object(*args):
+        if object_cost_ms:
+            time.sleep(object_cost_ms / 1000.0)
+        object_id = uuid.uuid4()
+        document_objects[str(object_id)] = StubRhinoObject(object_id)
+        return object_id
+
+    rs = types.ModuleType("rhinoscriptsyntax")
+    rs.AddBox = add_object
+    rs.AddSphere = add_object
+    rs.Redraw = lambda: None
+    rs.DeleteObjects = lambda object_ids: len(object_ids)
+    rs.coercerhinoobject = lambda object_id: document_objects.get(str(object_id))
+
+    rhino = types.ModuleType("Rhino")
+    for name in ("Geometry", "RhinoDoc", "DocObjects"):
+        setattr(rhino, name, Stub())
+    StubMesh.tessellation_ms = tessellation_ms
+    rhino.Geometry.Mesh = StubMesh
+    rhino.Geometry.Brep = types.SimpleNamespace(TryConvertBrep=lambda geometry: geometry)
+    rhino.RhinoDoc.ActiveDoc = StubDocument()
+    rhino.FileIO = types.SimpleNamespace(File3dm=StubFile3dm)
+
+    system = types.ModuleType("System")
+    system.Guid = uuid.UUID
+    system.Collections = types.SimpleNamespace(
+        Generic=types.SimpleNamespace(List=StubList)
+    )
+
+    sys.modules["rhinoscriptsyntax"] = rs
+    sys.modules["Rhino"] = rhino
+    sys.modules["System"] = system
+
+
+def post(port, payload):
+    """
+    Send one command to the server
+
+    Returns:
+        tuple: (HTTP status, response headers, body bytes, elapsed ms)
+    """
+    start = time.perf_counter()
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+    connection.request(
+        "POST", "/", json.dumps(payload),
+        {"Content-Type": "application/json"}
+    )
+    response = connection.getresponse()
+    body = response.read()
+    connection.close()
+    return response.status, response.headers, body, (time.perf_counter() - start) * 1000.0
+
+
+class ConsoleSink:
+    """
+    stdout replacement that pays a real write system call per write
+    (like an unbuffered console) and counts the lines written
+    """
+
+    def __init__(self):
+        self.lines = 0
+        self._fd = os.open(os.devnull, os.O_WRONLY)
+
+    def write(self, text):
+        self.lines += text.count("\n")
+        return os.write(self._fd, text.encode("utf-8"))
+
+    def flush(self):
+        pass
+
+    def close(self):
+        os.close(self._fd)
+
+
+def summarize(timings):
+    """Mean, median and 95th percentile of a list of milliseconds"""
+    ordered = sorted(timings)
+    return (
+        f"mean {sum(ordered) / len(ordered):7.3f} ms  "
+        f"p50 {ordered[len(ordered) // 2]:7.3f} ms  "
+        f"p95 {ordered[int(len(ordered) * 0.95)]:7.3f} ms"
+    )
+
+
+def bench_requests(server, requests):
+    """
+    Per-request latency in QUIET and VERBOSE mode
+
+    Console output goes to a ConsoleSink, so every write costs a real
+    system call (Rhino's console is slower still).
+    """
+    print("\nPer-request overhead (console: one write syscall per write)")
+    commands = {
+        "ping": {"action": "ping"},
+        "create_box": {"action": "create_box", "params": {"x": 1, "y": 2, "z": 3}}
+    }
+    console = ConsoleSink()
+    for verbosity, label in ((server_module.QUIET, "quiet"), (server_module.VERBOSE, "verbose")):
+        server.verbosity = verbosity
+        for name, payload in commands.items():
+            with redirect_stdout(console):
+                post(server.port, payload)  # Warm-up (loads the stub modules)
+                lines_before = console.lines
+                timings = [post(server.port, payload)[3] for _ in range(requests)]
+                lines = (console.lines - lines_before) / float(requests)
+            print(f"  {label:8} {name:11} {summarize(timings)}  "
+                  f"{lines:4.1f} console lines/request")
+    console.close()
+    server.verbosity = server_module.QUIET
+
+
+def bench_result_modes(server, objects):
+    """Response size and serialise time of one large create_batch per result mode"""
+    print(f"\nResult modes (create_batch with {objects} boxes)")
+    items = [{"type": "box", "x": i, "y": i % 100, "z": 0} for i in range(objects)]
+    for mode in server_module.RESULT_MODES:
+        status, headers, body, elapsed = post(server.port, {
+            "action": "create_batch",
+            "params": {"items": items},
+            "result_mode": mode
+        })
+        print(
+            f"  {mode:8} HTTP {status}  {len(body):>9} bytes  "
+            f"serialise {float(headers['X-Serialize-Ms']):8.3f} ms  "
+            f"round trip {elapsed:9.3f} ms"
+        )
+
+
+def bench_atomic(server, objects, runs=6):
+    """
+    create_batch overhead of atomic mode versus non-atomic mode, plus the
+    rollback of an atomic batch whose last item fails
+
+    Times are the server-side elapsed_ms of create_batch (no HTTP/JSON).
+    The two modes alternate which one runs first, so drift over the run
+    (e.g. the growing stub document) does not favour either.
+    """
+    print(f"\nAtomic batches (create_batch with {objects} boxes, median of {runs})")
+    items = [{"type": "box", "x": i, "y": 0, "z": 0} for i in range(objects)]
+    timings = {False: [], True: []}
+    for run in range(runs):
+        for atomic in ((False, True) if run % 2 else (True, False)):
+            body = post(server.port, {
+                "action": "create_batch",
+                "params": {"items": items, "atomic": atomic}
+            })[2]
+            timings[atomic].append(json.loads(body)["elapsed_ms"])
+    median = {}
+    for atomic in (False, True):
+        median[atomic] = sorted(timings[atomic])[runs // 2]
+        print(f"  {'atomic' if atomic else 'non-atomic':10} {median[atomic]:9.3f} ms")
+    overhead = median[True] - median[False]
+    print(f"  Atomic overhead: {overhead:.3f} ms ({overhead / median[False] * 100:.1f} %)")
+
+    # Unknown type as the last item: everything before it is rolled back
+    failing = items[:-1] + [{"type": "cone"}]
+    result = json.loads(post(server.port, {
+        "action": "create_batch",
+        "params": {"items": failing, "atomic": True}
+    })[2])
+    print(f"  Failing atomic batch: rolled back {result['rolled_back']} objects "
+          f"in {result['rollback_ms']:.3f} ms (batch {result['elapsed_ms']:.3f} ms, "
+          f"error at item {result['errors'][0]['index']})")
+    return result["rolled_back"] == objects - 1 and not result["geometry_ids"]
+
+
+def bench_mesh_cache(server, objects, budget_entries=10):
+    """
+    First versus repeated get_bounding_box and get_mesh reads over an
+    unchanged scene, then invalidation after a change and eviction under a
+    budget of budget_entries meshes
+
+    Returns:
+        bool: True if repeated reads were all cache hits (and faster for
+            meshes), changed objects were re-read and eviction kept the budget
+    """
+    print(f"\nMesh cache ({objects} boxes, {StubMesh.tessellation_ms} ms simulated "
+          f"meshing per object)")
+    server_module.mesh_cache = server_module.MeshCache()
+    object_ids = json.loads(post(server.port, {
+        "action": "create_batch",
+        "params": {"items": [{"type": "box", "x": i} for i in range(objects)]},
+        "result_mode": "ids"
+    })[2])["geometry_ids"]
+
+    def read(action, ids):
+        timings = []
+        cached = 0
+        for object_id in ids:
+            body, elapsed = post(server.port, {
+                "action": action,
+                "params": {"object_id": object_id}
+            })[2:]
+            timings.append(elapsed)
+            cached += json.loads(body)["cached"]
+        return timings, cached
+
+    ok = True
+    for action in ("get_bounding_box", "get_mesh"):
+        first, first_cached = read(action, object_ids)
+        repeated, repeated_cached = read(action, object_ids)
+        print(f"  {action:16} first    {summarize(first)}  {first_cached:5} cached")
+        print(f"  {action:16} repeated {summarize(repeated)}  {repeated_cached:5} cached")
+        ok = ok and first_cached == 0 and repeated_cached == objects
+    # Only meshing is expensive enough to beat the HTTP round trip
+    ok = ok and sum(repeated) < sum(first)
+    stats = json.loads(post(server.port, {"action": "mesh_cache_stats"})[2])["stats"]
+    print(f"  Stats: {stats['entries']} entries, {stats['bytes']} bytes, "
+          f"hit rate {stats['hit_rate']}")
+
+    # A modified object gets a new serial number; a deleted one fires an event
+    document_objects[object_ids[0]].RuntimeSerialNumber += 1
+    server_module._on_object_changed(None, types.SimpleNamespace(ObjectId=object_ids[1]))
+    _, cached = read("get_mesh", object_ids[:2])
+    invalidations = server_module.mesh_cache.stats()["invalidations"]
+    print(f"  Changed objects: {cached} of 2 served from cache, {invalidations} invalidations")
+    ok = ok and cached == 0 and invalidations == 2
+
+    entry_bytes = stats["bytes"] // stats["entries"]
+    server_module.mesh_cache = server_module.MeshCache(max_bytes=entry_bytes * budget_entries)
+    read("get_mesh", object_ids)
+    small = server_module.mesh_cache.stats()
+    print(f"  Budget of {budget_entries} meshes ({small['max_bytes']} bytes): "
+          f"{small['entries']} entries, {small['bytes']} bytes, {small['evictions']} evictions")
+    ok = (
+        ok and small["entries"] == budget_entries and small["bytes"] <= small["max_bytes"]
+        and small["evictions"] == objects - budget_entries
+    )
+    server_module.mesh_cache = server_module.MeshCache()
+
+    if not ok:
+        print("  FAIL: mesh cache did not hit, invalidate or evict as expected")
+    return ok
+
+
+def check_file_paths(server):
+    """
+    save_path and import_files paths outside the temp folder are refused
+    before anything is created, read or deleted
+
+    Returns:
+        bool: True if both requests were refused
+    """
+    print("\nFile path checks (paths outside the temp and shard folders)")
+    outside = os.path.join(os.path.dirname(os.path.abspath(__file__)), "outside.3dm")
+    saved = json.loads(post(server.port, {
+        "action": "create_batch",
+        "params": {"items": [{"type": "box"}], "save_path": outside}
+    })[2])
+    imported = json.loads(post(server.port, {
+        "action": "import_files",
+        "params": {"paths": [outside], "delete_files": True}
+    })[2])
+    ok = (
+        saved["status"] == "error" and "geometry_ids" not in saved
+        and imported["errors"] and not imported["geometry_ids"]
+        and not os.path.exists(outside)
+    )
+    print(f"  save_path:    {saved['message']}")
+    print(f"  import_files: {imported['errors'][0]['message'] if imported['errors'] else 'accepted'}")
+    if not ok:
+        print("  FAIL: a path outside the allowed folders was accepted")
+    return ok
+
+
+def bench_flood(clients, requests):
+    """
+    Synthetic flood against the default rate limits
+
+    Returns:
+        bool: True if the flood was throttled (429s) and every admitted
+            request was released again (in_flight back to 0)
+    """
+    print(f"\nFlood ({clients} clients x {requests} create_box requests, default limits)")
+    server = server_module.RhinoServer(port=0, host="127.0.0.1", verbosity=server_module.QUIET)
+    server.start()
+    statuses = {}
+    lock = threading.Lock()
+
+    def client():
+        for _ in range(requests):
+            status = post(server.port, {"action": "create_box"})[0]
+            with lock:
+                statuses[status] = statuses.get(status, 0) + 1
+
+    threads = [threading.Thread(target=client) for _ in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    limits = json.loads(post(server.port, {"action": "server_stats"})[2])["stats"]["limits"]
+    server.stop()
+    print(f"  Responses by status: {dict(sorted(statuses.items()))}")
+    print(
+        f"  Admitted {limits['admitted']}, rejected (rate) {limits['rejected_rate']}, "
+        f"rejected (busy) {limits['rejected_busy']}, in flight afterwards {limits['in_flight']}"
+    )
+    ok = statuses.get(429, 0) > 0 and limits["in_flight"] == 0
+    if not ok:
+        print("  FAIL: flood was not throttled or requests were left in flight")
+    return ok
+
+
+def load_mcp_module():
+    """Import the MCP server, or return None if its packages are missing"""
+    try:
+        import phase3_rhino_mcp_server
+    except ImportError as e:
+        print(f"\nMCP checks skipped ({e})")
+        return None
+    return phase3_rhino_mcp_server
+
+
+def use_instances(mcp_module, ports):
+    """
+    Point the MCP server's instance registry at local stub servers
+
+    Args:
+        mcp_module: The imported phase3_rhino_mcp_server module
+        ports (dict): Instance name -> port (the first entry is the primary)
+    """
+    os.environ["RHINO_INSTANCES"] = ",".join(
+        f"{name}=http://127.0.0.1:{port}" for name, port in ports.items()
+    )
+    mcp_module.INSTANCES = mcp_module.load_instances()
+    mcp_module.PRIMARY_INSTANCE = next(iter(mcp_module.INSTANCES))
+    mcp_module.executor = mcp_module.ThreadPoolExecutor(
+        max_workers=sum(i.pool_size for i in mcp_module.INSTANCES.values())
+    )
+
+
+def bench_create_boxes_flood(mcp_module, boxes):
+    """
+    A large create_boxes batch against one server with the default limits
+
+    Every chunk must eventually be admitted: the MCP server paces itself to
+    the server's Retry-After instead of giving up.
+
+    Returns:
+        bool: True if every box was created
+    """
+    print(f"\nLarge create_boxes under default limits ({boxes} boxes, "
+          f"{mcp_module.BATCH_CHUNK_SIZE} per chunk)")
+    server = server_module.RhinoServer(port=0, host="127.0.0.1", verbosity=server_module.QUIET)
+    server.start()
+    use_instances(mcp_module, {"bench": server.port})
+
+    start = time.perf_counter()
+    output = mcp_module.create_boxes([{"x": i, "y": 0, "z": 0} for i in range(boxes)])
+    elapsed = time.perf_counter() - start
+    limits = server.rate_limiter.stats()
+    throttled = mcp_module.INSTANCES["bench"].stats()["throttled"]
+    server.stop()
+
+    created = int(re.search(r"Created (\d+) of", output).group(1))
+    print(f"  Created {created} of {boxes} in {elapsed:.1f} s ({created / elapsed:.0f} boxes/s, "
+          f"{throttled} throttled retries, {limits['rejected_rate']} rejected by rate)")
+    if created != boxes:
+        print("  FAIL: batch left incomplete")
+    return created == boxes
+
+
+def start_stub_process(object_cost_ms):
+    """
+    Run a stub Rhino server in its own process (like a separate Rhino instance)
+
+    Returns:
+        tuple: (Popen, port)
+    """
+    process = subprocess.Popen(
+        [sys.executable, os.path.abspath(__file__), "--serve",
+         "--object-cost-ms", str(object_cost_ms)],
+        stdout=subprocess.PIPE, text=True
+    )
+    return process, int(process.stdout.readline())
+
+
+def bench_sharding(mcp_module, objects, object_cost_ms, worker_counts=(1, 2, 4)):
+    """
+    Wall-clock time of generate_scene_sharded for several worker counts
+
+    Returns:
+        bool: True if every run merged all objects into the primary
+    """
+    print(f"\nSharded scene generation ({objects} boxes, "
+          f"{object_cost_ms} ms simulated kernel time per object)")
+    items = [{"type": "box", "x": i % 100, "y": i // 100, "z": 0} for i in range(objects)]
+    ok = True
+    baseline = None
+
+    for workers in worker_counts:
+        processes = [start_stub_process(object_cost_ms) for _ in range(workers + 1)]
+        ports = {"primary": processes[0][1]}
+        for number, (_, port) in enumerate(processes[1:], 1):
+            ports[f"worker{number}"] = port
+        use_instances(mcp_module, ports)
+
+        start = time.perf_counter()
+        result = mcp_module.scatter_gather(items, "spatial")
+        elapsed = time.perf_counter() - start
+        for process, _ in processes:
+            process.terminate()
+            process.wait()
+
+        baseline = baseline or elapsed
+        print(f"  {workers} worker(s): {elapsed:7.3f} s  speed-up {baseline / elapsed:4.2f}x  "
+              f"merged {result['created']} of {objects}")
+        if result["created"] != objects or result["errors"]:
+            print(f"  FAIL: {result['errors']}")
+            ok = False
+    return ok
+
+
+def serve_stub(object_cost_ms):
+    """--serve mode: run one stub server with default limits, print its port, serve forever"""
+    install_stub_modules(object_cost_ms)
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import phase2_rhino_http_server_FIXED as module
+    server = module.RhinoServer(port=0, host="127.0.0.1", verbosity=module.QUIET).start()
+    print(server.port, flush=True)
+    server.thread.join()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500, help="requests per measurement")
+    parser.add_argument("--objects", type=int, default=10000, help="objects in the batch benchmark")
+    parser.add_argument("--mesh-objects", type=int, default=1000,
+                        help="objects in the mesh cache benchmark")
+    parser.add_argument("--tessellation-ms", type=float, default=1.0,
+                        help="simulated meshing time per object")
+    parser.add_argument("--flood-boxes", type=int, default=40000,
+                        help="boxes in the create_boxes flood check")
+    parser.add_argument("--shard-objects", type=int, default=4000,
+                        help="boxes in the sharding benchmark")
+    parser.add_argument("--object-cost-ms", type=float, default=0.5,
+                        help="simulated kernel time per object in sharding workers")
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve_stub(args.object_cost_ms)
+        sys.exit(0)
+
+    install_stub_modules(tessellation_ms=args.tessellation_ms)
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+    start = time.perf_counter()
+    import phase2_rhino_http_server_FIXED as server_module
+    import_ms = (time.perf_counter() - start) * 1000.0
+
+    print("Startup")
+    print(f"  Module import: {import_ms:.3f} ms (Rhino modules loaded: {server_module.Rhino is not None})")
+
+    # Admission control would throttle the benchmark itself
+    unlimited = server_module.RateLimiter(rate=1e9, burst=1e9, action_limits={}, max_in_flight=1000)
+    server = server_module.RhinoServer(
+        port=0, host="127.0.0.1", verbosity=server_module.QUIET, rate_limiter=unlimited
+    )
+    server.start()
+    print(f"  Server start:  {server.startup_ms:.3f} ms (port {server.port})")
+
+    bench_requests(server, args.requests)
+    bench_result_modes(server, args.objects)
+    failures = 0
+    failures += not bench_atomic(server, args.objects)
+    failures += not check_file_paths(server)
+    failures += not bench_mesh_cache(server, args.mesh_objects)
+    server.stop()
+
+    failures += not bench_flood(clients=8, requests=20)
+
+    mcp_module = load_mcp_module()
+    if mcp_module is not None:
+        failures += not bench_create_boxes_flood(mcp_module, args.flood_boxes)
+        failures += not bench_sharding(mcp_module, args.shard_objects, args.object_cost_ms)
+
+    sys.exit(1 if failures else 0)
@@ -5,13 +5,23 @@ Receives geometry commands via HTTP and creates geometry in active document
 PROBLEM FIXED: Original version froze Rhino's UI because the server blocked the main thread.
 SOLUTION: Server now runs in a separate thread, keeping Rhino responsive!
 
+CONFIGURATION:
+Edit the RhinoServer(...) call at the bottom of this file to change the
+port, bind address, console output (QUIET, NORMAL, VERBOSE), the enabled
+feature modules or the shard folders. In QUIET mode requests do no console
+I/O at all.
+
+The server has no authentication, so requests can only read, write and
+delete .3dm files inside the temp folder and the configured shard folders
+(set shard_dirs to the RHINO_SHARD_DIR used by the MCP server).
+
 INSTRUCTIONS FOR USE:
 1. Open Rhino 8
 2. Type 'EditPythonScript' in command line
 3. Copy this entire file into the Python editor
 4. Save it as 'rhino_http_server.py' (File → Save As)
 5. Click Run button (play icon)
-6. You should see: " Server is running! Waiting for commands..."
+6. You should see: " Rhino HTTP server running on http://0.0.0.0:8080"
 7. Rhino will stay responsive! You can work normally while server runs
 
 To stop: Close the Python editor window
@@ -20,15 +30,522 @@ Author: Olaf Olden
 Date: 2025-11-22
 """
 
-import rhinoscriptsyntax as rs
-import Rhino
-import BaseHTTPServer
 import json
 import traceback
 import threading
+import collections
+import os
+import tempfile
+import time
+import math
+
+try:
+    import BaseHTTPServer
+    import SocketServer
+except ImportError:
+    # Python 3 (Rhino 8 CPython editor, headless benchmarks)
+    import http.server as BaseHTTPServer
+    import socketserver as SocketServer
+
+# Rhino modules are heavy to import, so they are loaded on first use
+# (see load_rhino)
+rs = None
+Rhino = None
+System = None
+
+# Console output levels for RhinoServer(verbosity=...)
+QUIET = 0      # No console output at all
+NORMAL = 1     # Short startup banner and errors
+VERBOSE = 2    # Full banner plus every request and response
+
+# Feature modules that can be enabled per server, with the actions they add
+# ('ping' is always available)
+FEATURES = collections.OrderedDict([
+    ('geometry', ('create_box', 'create_sphere')),
+    ('batch', ('create_batch', 'import_files')),
+    ('mesh_cache', ('get_bounding_box', 'get_mesh', 'mesh_cache_stats')),
+    ('stats', ('response_stats', 'server_stats'))
+])
+
+# Command descriptions for the verbose startup banner
+ACTION_HELP = collections.OrderedDict([
+    ('create_box', 'Creates a box with specified dimensions'),
+    ('create_sphere', 'Creates a sphere with specified radius'),
+    ('create_batch', 'Creates many objects with a single redraw'),
+    ('import_files', 'Merges .3dm files into the document'),
+    ('get_bounding_box', 'Reads back an object\'s bounding box (cached)'),
+    ('get_mesh', 'Reads back an object\'s mesh (cached)'),
+    ('mesh_cache_stats', 'Mesh cache hit-rate statistics'),
+    ('response_stats', 'Response size and serialise time per result_mode'),
+    ('server_stats', 'Rate limit, response and cache counters'),
+    ('ping', 'Check if server is running')
+])
+
+
+def load_rhino():
+    """
+    Import rhinoscriptsyntax, Rhino and System on first use
+
+    Importing this file stays cheap (and works outside Rhino); the cost is
+    paid by the first request that touches the document.
+    """
+    global rs, Rhino, System
+    if Rhino is None:
+        import rhinoscriptsyntax as rs
+        import System
+        import Rhino
+
+# Memory budget for cached meshes (bytes, estimated)
+MESH_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Admission control: token bucket per client address and action
+RATE_LIMIT_PER_SECOND = 20.0
+RATE_LIMIT_BURST = 40
+# Per-action overrides as (requests per second, burst). The limits stop
+# runaway loops, not bulk work: the MCP server sends create_batch in chunks
+# of 1000 objects (BATCH_CHUNK_SIZE), so 10/s allows 10000 objects/s per
+# client (after a burst of 20000) before create_boxes is paced.
+ACTION_RATE_LIMITS = {
+    'create_batch': (10.0, 20),
+    'import_files': (1.0, 2)
+}
+# Requests admitted but not finished (running or waiting for the document)
+MAX_IN_FLIGHT = 8
+
+# Actions that never touch the document: they skip the document lock and
+# do not count as in-flight work, so stats stay readable during a flood
+LIGHTWEIGHT_ACTIONS = ('ping', 'server_stats', 'mesh_cache_stats', 'response_stats')
+
+# Document changes are made by one request at a time
+document_lock = threading.Lock()
+
+
+class RateLimiter(object):
+    """
+    Token-bucket rate limiting per (client address, action) plus a global
+    cap on the number of requests in flight
+    """
+
+    # Idle buckets are pruned once there are more than this many
+    MAX_BUCKETS = 1024
+
+    def __init__(self, rate=RATE_LIMIT_PER_SECOND, burst=RATE_LIMIT_BURST,
+                 action_limits=None, max_in_flight=MAX_IN_FLIGHT):
+        self.rate = rate
+        self.burst = burst
+        self.action_limits = action_limits if action_limits is not None else ACTION_RATE_LIMITS
+        self.max_in_flight = max_in_flight
+        self.in_flight = 0
+        self.admitted = 0
+        self.rejected_rate = 0
+        self.rejected_busy = 0
+        # (client, action) -> [tokens, last refill time]
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def admit(self, client, action):
+        """
+        Decide whether a request may run now
+
+        Args:
+            client (str): Client address
+            action (str): Requested action
+
+        Returns:
+            tuple: (0, None) if admitted (call release() when done), otherwise
+                the number of seconds the client should wait before retrying
+                and the limit that was hit: 'rate' (this client and action)
+                or 'busy' (in-flight cap, every action)
+        """
+        rate, burst = self.action_limits.get(action, (self.rate, self.burst))
+        counted = action not in LIGHTWEIGHT_ACTIONS
+        now = time.time()
+
+        with self._lock:
+            if counted and self.in_flight >= self.max_in_flight:
+                self.rejected_busy += 1
+                return 1.0, 'busy'
+
+            key = (client, action)
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                if len(self._buckets) >= self.MAX_BUCKETS:
+                    self._prune(now)
+                bucket = self._buckets[key] = [float(burst), now]
+
+            # Refill for the time since the last request
+            bucket[0] = min(float(burst), bucket[0] + (now - bucket[1]) * rate)
+            bucket[1] = now
+            if bucket[0] < 1.0:
+                self.rejected_rate += 1
+                return (1.0 - bucket[0]) / rate, 'rate'
+
+            bucket[0] -= 1.0
+            self.admitted += 1
+            if counted:
+                self.in_flight += 1
+            return 0.0, None
+
+    def release(self, action):
+        """Mark an admitted request as finished"""
+        if action not in LIGHTWEIGHT_ACTIONS:
+            with self._lock:
+                self.in_flight -= 1
+
+    def stats(self):
+        """Return limit settings and counters as a dict"""
+        with self._lock:
+            return {
+                'rate_per_second': self.rate,
+                'burst': self.burst,
+                'action_limits': dict(
+                    (action, {'rate_per_second': rate, 'burst': burst})
+                    for action, (rate, burst) in self.action_limits.items()
+                ),
+                'max_in_flight': self.max_in_flight,
+                'in_flight': self.in_flight,
+                'admitted': self.admitted,
+                'rejected_rate': self.rejected_rate,
+                'rejected_busy': self.rejected_busy,
+                'clients': len(set(client for client, _ in self._buckets))
+            }
+
+    def _prune(self, now):
+        # Buckets idle for a minute have refilled completely anyway
+        for key in [k for k, b in self._buckets.items() if now - b[1] > 60.0]:
+            del self._buckets[key]
+
+
+class MeshCache(object):
+    """
+    LRU cache of tessellated meshes and bounding boxes for document objects
+
+    Entries are keyed by object GUID and checked against the object's
+    RuntimeSerialNumber. Rhino replaces an object (and gives it a new serial
+    number) every time it is modified, so a serial mismatch means the cached
+    mesh is stale. Document events also invalidate entries directly.
+    """
+
+    def __init__(self, max_bytes=MESH_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._entries = collections.OrderedDict()
+        # Document events arrive on Rhino's UI thread, lookups on the server thread
+        self._lock = threading.Lock()
+
+    def lookup(self, rhino_object, with_mesh=False):
+        """
+        Get the cached bounding box (and optionally mesh) for an object
+
+        Bounding boxes are cheap and cached on their own; the object is only
+        tessellated when a mesh is requested.
+
+        Args:
+            rhino_object: Rhino.DocObjects.RhinoObject to look up
+            with_mesh (bool): Also return the tessellated mesh
+
+        Returns:
+            tuple: (entry dict with 'bbox', 'mesh' (None unless tessellated)
+                and 'bytes', True if it was a hit)
+        """
+        key = str(rhino_object.Id)
+        serial = rhino_object.RuntimeSerialNumber
+
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None and entry['serial'] != serial:
+                # Object was modified since it was cached
+                self.total_bytes -= entry['bytes']
+                self.invalidations += 1
+                entry = None
+            elif entry is not None and (entry['mesh'] is not None or not with_mesh):
+                # Re-insert at the most recently used end
+                self._entries[key] = entry
+                self.hits += 1
+                return entry, True
+            elif entry is not None:
+                # Cached bounding box only, re-stored below with its mesh
+                self.total_bytes -= entry['bytes']
+            self.misses += 1
+
+        # Build outside the lock so document events are never blocked
+        if entry is None:
+            entry = self._build_entry(rhino_object, serial)
+        if with_mesh:
+            entry = self._add_mesh(entry, rhino_object)
+
+        with self._lock:
+            self._store(key, entry)
+        return entry, False
+
+    def invalidate(self, object_id):
+        """Drop the entry for a single object GUID (if cached)"""
+        with self._lock:
+            entry = self._entries.pop(str(object_id), None)
+            if entry is not None:
+                self.total_bytes -= entry['bytes']
+                self.invalidations += 1
+
+    def clear(self):
+        """Drop every entry, e.g. when the document is closed"""
+        with self._lock:
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+            self.total_bytes = 0
+
+    def stats(self):
+        """Return cache size and hit-rate statistics as a dict"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self.total_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / float(lookups), 4) if lookups else 0.0,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations
+            }
+
+    def _store(self, key, entry):
+        # Objects larger than the whole budget are returned but never cached
+        if entry['bytes'] > self.max_bytes:
+            return
+        self._entries[key] = entry
+        self.total_bytes += entry['bytes']
+        while self.total_bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.total_bytes -= evicted['bytes']
+            self.evictions += 1
+
+    def _build_entry(self, rhino_object, serial):
+        return {
+            'serial': serial,
+            'mesh': None,
+            'bbox': rhino_object.Geometry.GetBoundingBox(True),
+            # Bounding box plus dict overhead
+            'bytes': 256
+        }
+
+    def _add_mesh(self, entry, rhino_object):
+        geometry = rhino_object.Geometry
 
-# Global variable to control server
-server_running = True
+        if isinstance(geometry, Rhino.Geometry.Mesh):
+            mesh = geometry.DuplicateMesh()
+        else:
+            mesh = Rhino.Geometry.Mesh()
+            brep = Rhino.Geometry.Brep.TryConvertBrep(geometry)
+            if brep is not None:
+                parts = Rhino.Geometry.Mesh.CreateFromBrep(
+                    brep, Rhino.Geometry.MeshingParameters.Default)
+                for part in parts or []:
+                    mesh.Append(part)
+
+        # Rough footprint: float3 vertices + normals, quad faces, fixed overhead
+        nbytes = (mesh.Vertices.Count * 24) + (mesh.Faces.Count * 16) + 256
+
+        return dict(entry, mesh=mesh, bytes=entry['bytes'] + nbytes)
+
+
+mesh_cache = MeshCache()
+
+
+def _on_object_changed(sender, e):
+    """Document event handler: object deleted or replaced"""
+    mesh_cache.invalidate(e.ObjectId)
+
+
+def _on_document_closed(sender, e):
+    """Document event handler: cached meshes belong to the closed document"""
+    mesh_cache.clear()
+
+
+# Response shapes selectable with the top-level 'result_mode' command key
+RESULT_MODES = ('full', 'ids', 'summary')
+
+# Keys that callers need for follow-up work, kept in every result mode
+PRESERVED_KEYS = ('saved_path', 'rolled_back')
+
+
+def grow_bounds(bounds, bb_min, bb_max):
+    """
+    Grow a bounding box dict ({'min': [x, y, z], 'max': [x, y, z]}) in place
+
+    Args:
+        bounds (dict): Current bounds, or None to start new bounds
+        bb_min (list): Minimum corner to include
+        bb_max (list): Maximum corner to include
+
+    Returns:
+        dict: The grown bounds
+    """
+    if bounds is None:
+        return {'min': list(bb_min), 'max': list(bb_max)}
+    for axis in range(3):
+        bounds['min'][axis] = min(bounds['min'][axis], bb_min[axis])
+        bounds['max'][axis] = max(bounds['max'][axis], bb_max[axis])
+    return bounds
+
+
+def result_bounds(result):
+    """Bounding box implied by a full action result, or None"""
+    if 'bounding_box' in result:
+        return result['bounding_box']
+    if 'position' in result and 'dimensions' in result:
+        position = result['position']
+        dimensions = result['dimensions']
+        return {
+            'min': list(position),
+            'max': [position[axis] + dimensions[axis] for axis in range(3)]
+        }
+    if 'center' in result and 'radius' in result:
+        center = result['center']
+        radius = result['radius']
+        return {
+            'min': [value - radius for value in center],
+            'max': [value + radius for value in center]
+        }
+    if 'min' in result and 'max' in result:
+        return {'min': result['min'], 'max': result['max']}
+    return None
+
+
+def shape_result(result, result_mode):
+    """
+    Reduce a full action result to the requested result mode
+
+    'full' returns the result unchanged, 'ids' keeps only the GUIDs and
+    'summary' keeps an object count, the bounding box and the error list.
+    Results that carry no geometry (ping, statistics) are never reduced.
+
+    Args:
+        result (dict): Full result of an action
+        result_mode (str): One of RESULT_MODES
+
+    Returns:
+        dict: Shaped result
+    """
+    if result_mode == 'full':
+        return result
+    if 'geometry_id' not in result and 'geometry_ids' not in result:
+        return result
+
+    shaped = {'status': result['status']}
+    if result['status'] not in ('success', 'ok'):
+        shaped['message'] = result.get('message', '')
+    for key in PRESERVED_KEYS:
+        if key in result:
+            shaped[key] = result[key]
+
+    if result_mode == 'ids':
+        if 'geometry_id' in result:
+            shaped['geometry_id'] = result['geometry_id']
+        else:
+            shaped['geometry_ids'] = result['geometry_ids']
+        if result.get('errors'):
+            shaped['errors'] = result['errors']
+    else:
+        shaped['count'] = len(result['geometry_ids']) if 'geometry_ids' in result else 1
+        shaped['bounding_box'] = result_bounds(result)
+        shaped['errors'] = result.get('errors', [])
+    return shaped
+
+
+class ResponseStats(object):
+    """
+    Payload size and JSON serialisation time of responses, per result mode
+    """
+
+    def __init__(self):
+        self._modes = {}
+        self._lock = threading.Lock()
+
+    def record(self, result_mode, nbytes, serialize_ms):
+        """Record one serialised response"""
+        with self._lock:
+            entry = self._modes.setdefault(result_mode, {
+                'responses': 0,
+                'bytes': 0,
+                'max_bytes': 0,
+                'serialize_ms': 0.0
+            })
+            entry['responses'] += 1
+            entry['bytes'] += nbytes
+            entry['max_bytes'] = max(entry['max_bytes'], nbytes)
+            entry['serialize_ms'] += serialize_ms
+
+    def stats(self):
+        """Return per-mode totals and averages as a dict"""
+        with self._lock:
+            result = {}
+            for result_mode, entry in self._modes.items():
+                result[result_mode] = dict(
+                    entry,
+                    serialize_ms=round(entry['serialize_ms'], 3),
+                    avg_bytes=entry['bytes'] // entry['responses'],
+                    avg_serialize_ms=round(entry['serialize_ms'] / entry['responses'], 3)
+                )
+            return result
+
+
+response_stats = ResponseStats()
+
+
+def checked_file_path(path, allowed_dirs):
+    """
+    Resolve a .3dm path from a request and check that it may be touched
+
+    Args:
+        path (str): Requested file; relative paths are placed in the temp folder
+        allowed_dirs (list): Folders whose files requests may read, write and delete
+
+    Returns:
+        str: Absolute, resolved path
+
+    Raises:
+        ValueError: If the path is not a .3dm file inside an allowed folder
+    """
+    if not os.path.isabs(path):
+        path = os.path.join(tempfile.gettempdir(), path)
+    path = os.path.realpath(path)
+    if not path.lower().endswith('.3dm'):
+        raise ValueError('Not a .3dm file: ' + path)
+
+    # Compare resolved folders so '..' and links cannot escape them
+    for folder in allowed_dirs:
+        folder = os.path.normcase(os.path.join(os.path.realpath(folder), ''))
+        if os.path.normcase(path).startswith(folder):
+            return path
+    raise ValueError('Path outside the temp and shard folders: ' + path)
+
+
+def save_objects(object_ids, path):
+    """
+    Write document objects to a .3dm file
+
+    Args:
+        object_ids (list): GUIDs (strings) of the objects to save
+        path (str): Target file (checked with checked_file_path)
+
+    Returns:
+        str: Absolute path of the written file
+    """
+    model = Rhino.FileIO.File3dm()
+    for object_id in object_ids:
+        rhino_object = rs.coercerhinoobject(object_id)
+        if rhino_object is not None:
+            model.Objects.Add(rhino_object.Geometry, Rhino.DocObjects.ObjectAttributes())
+
+    written = model.Write(path, 0)
+    model.Dispose()
+    if not written:
+        raise IOError('Cannot write file: ' + path)
+    return path
 
 
 class RhinoGeometryHandler(BaseHTTPServer.BaseHTTPRequestHandler):
@@ -36,6 +553,9 @@ class RhinoGeometryHandler(BaseHTTPServer.BaseHTTPRequestHandler):
     Handles HTTP requests and translates them to Rhino geometry commands
     """
 
+    # Result mode of the current request (set from the command in do_POST)
+    result_mode = 'full'
+
     def do_POST(self):
         """
         Handle POST requests containing JSON commands
@@ -53,49 +573,129 @@ class RhinoGeometryHandler(BaseHTTPServer.BaseHTTPRequestHandler):
             }
         }
         """
+        config = self.server.rhino_server
         try:
             # Read the request body
-            content_length = int(self.headers.getheader('content-length', 0))
+            content_length = int(self.headers.get('content-length', 0))
             body = self.rfile.read(content_length)
 
             # Parse JSON
             command = json.loads(body)
-            print("\n" + "=" * 50)
-            print("Received command: " + str(command))
+            if config.verbosity >= VERBOSE:
+                print("\n" + "=" * 50)
+                print("Received command: " + str(command))
 
             # Route to appropriate handler
             action = command.get('action', '')
             params = command.get('params', {})
+            self.result_mode = command.get('result_mode', 'full')
 
-            if action == 'create_box':
-                result = self.create_box(params)
-            elif action == 'create_sphere':
-                result = self.create_sphere(params)
-            elif action == 'ping':
-                result = {'status': 'ok', 'message': 'Rhino server is running!'}
-            else:
-                result = {'status': 'error', 'message': 'Unknown action: ' + action}
+            # Reject malformed requests before admission and the document lock
+            if self.result_mode not in RESULT_MODES:
+                self.send_json_response({
+                    'status': 'error',
+                    'message': 'Unknown result_mode: ' + str(self.result_mode)
+                })
+                return
+            # Only enabled actions get a rate limit bucket, so random action
+            # names cannot grow the limiter's state
+            if action not in config.actions:
+                self.send_json_response({
+                    'status': 'error',
+                    'message': 'Unknown action: ' + str(action)
+                })
+                return
+
+            # Admission control before any work is done
+            retry_after, limit = config.rate_limiter.admit(self.client_address[0], action)
+            if retry_after:
+                self.send_json_response({
+                    'status': 'error',
+                    'message': 'Too many requests, retry after ' + str(round(retry_after, 3)) + ' s',
+                    'retry_after': round(retry_after, 3),
+                    'limit': limit
+                }, status_code=429, headers={
+                    'Retry-After': str(int(math.ceil(retry_after)))
+                })
+                if config.verbosity >= VERBOSE:
+                    print("Rejected (429): " + action)
+                return
+
+            try:
+                if action in LIGHTWEIGHT_ACTIONS:
+                    result = self.dispatch(action, params)
+                else:
+                    with document_lock:
+                        config.ensure_rhino()
+                        result = self.dispatch(action, params)
+            finally:
+                config.rate_limiter.release(action)
 
             # Send response
-            self.send_json_response(result)
-            print("Response sent: " + str(result))
-            print("=" * 50)
+            result = shape_result(result, self.result_mode)
+            self.send_json_response(result, result_mode=self.result_mode)
+            if config.verbosity >= VERBOSE:
+                print("Response sent: " + str(result))
+                print("=" * 50)
 
         except Exception as e:
             error_msg = "Error processing request: " + str(e)
-            print("ERROR: " + error_msg)
-            print(traceback.format_exc())
+            if config.verbosity >= NORMAL:
+                print("ERROR: " + error_msg)
+                print(traceback.format_exc())
             self.send_json_response({
                 'status': 'error',
                 'message': error_msg
             }, status_code=500)
 
-    def create_box(self, params):
+    def dispatch(self, action, params):
+        """
+        Run an action and return its full result
+
+        Args:
+            action (str): Action name
+            params (dict): Parameters for the action
+
+        Returns:
+            dict: Result of the action
+        """
+        # Action names are method names; do_POST only lets enabled actions through
+        return getattr(self, action)(params)
+
+    def ping(self, params):
+        """Check that the server is running"""
+        return {'status': 'ok', 'message': 'Rhino server is running!'}
+
+    def mesh_cache_stats(self, params):
+        """Mesh cache hit-rate statistics"""
+        return {'status': 'success', 'stats': mesh_cache.stats()}
+
+    def response_stats(self, params):
+        """Response size and serialise time per result mode"""
+        return {'status': 'success', 'stats': response_stats.stats()}
+
+    def server_stats(self, params):
+        """Server configuration, rate limit, response and mesh cache counters"""
+        config = self.server.rhino_server
+        return {
+            'status': 'success',
+            'stats': {
+                'server': config.stats(),
+                'limits': config.rate_limiter.stats(),
+                'responses': response_stats.stats(),
+                'mesh_cache': mesh_cache.stats()
+            }
+        }
+
+    def create_box(self, params, redraw=True, with_guid=False):
         """
         Create a box in the active Rhino document
 
         Args:
             params (dict): Dictionary with x, y, z, width, height, depth
+            redraw (bool): Redraw the viewport afterwards (batches redraw once)
+            with_guid (bool): Also return the System.Guid under '_guid'
+                (for create_batch; not JSON serialisable)
 
         Returns:
             dict: Result with status and message
@@ -122,18 +722,28 @@ class RhinoGeometryHandler(BaseHTTPServer.BaseHTTPRequestHandler):
             box = Rhino.Geometry.Box(plane, x_interval, y_interval, z_interval)
 
             # Add to document
-            box_id = rs.coercebrep(rs.AddBox(box.GetCorners()))
+            box_id = rs.AddBox(box.GetCorners())
+            if not box_id:
+                # rhinoscriptsyntax returns None instead of raising
+                return {
+                    'status': 'error',
+                    'message': 'Failed to create box: Rhino did not add the object'
+                }
 
             # Redraw viewport to show new geometry
-            rs.Redraw()
+            if redraw:
+                rs.Redraw()
 
-            return {
+            result = {
                 'status': 'success',
                 'message': 'Box created successfully',
                 'geometry_id': str(box_id),
                 'position': [x, y, z],
                 'dimensions': [width, height, depth]
             }
+            if with_guid:
+                result['_guid'] = box_id
+            return result
 
         except Exception as e:
             return {
@@ -141,12 +751,15 @@ class RhinoGeometryHandler(BaseHTTPServer.BaseHTTPRequestHandler):
                 'message': 'Failed to create box: ' + str(e)
             }
 
-    def create_sphere(self, params):
+    def create_sphere(self, params, redraw=True, with_guid=False):
         """
         Create a sphere in the active Rhino document
 
         Args:
             params (dict): Dictionary with x, y, z, radius
+            redraw (bool): Redraw the viewport afterwards (batches redraw once)
+            with_guid (bool): Also return the System.Guid under '_guid'
+                (for create_batch; not JSON serialisable)
 
         Returns:
             dict: Result with status and message
@@ -160,17 +773,27 @@ class RhinoGeometryHandler(BaseHTTPServer.BaseHTTPRequestHandler):
             # Create sphere
             center = [x, y, z]
             sphere_id = rs.AddSphere(center, radius)
+            if not sphere_id:
+                # rhinoscriptsyntax returns None instead of raising
+                return {
+                    'status': 'error',
+                    'message': 'Failed to create sphere: Rhino did not add the object'
+                }
 
             # Redraw viewport
-            rs.Redraw()
+            if redraw:
+                rs.Redraw()
 
-            return {
+            result = {
                 'status': 'success',
                 'message': 'Sphere created successfully',
                 'geometry_id': str(sphere_id),
                 'center': center,
                 'radius': radius
             }
+            if with_guid:
+                result['_guid'] = sphere_id
+            return result
 
         except Exception as e:
             return {
@@ -178,65 +801,447 @@ class RhinoGeometryHandler(BaseHTTPServer.BaseHTTPRequestHandler):
                 'message': 'Failed to create sphere: ' + str(e)
             }
 
-    def send_json_response(self, data, status_code=200):
-        """Send JSON response back to client"""
+    def create_batch(self, params):
+        """
+        Create many objects in one request, redrawing only once at the end
+
+        Used by the MCP server for bulk work and by sharded scene generation,
+        where each worker instance saves its partition to a .3dm file. The
+        whole batch is one undo record. In atomic mode the batch stops at the
+        first failure and the objects it already created are deleted again
+        with a single ObjectTable.Delete call.
+
+        Args:
+            params (dict): Dictionary with items (list of dicts with 'type'
+                'box' or 'sphere' plus that action's params), optional
+                atomic (bool, roll back everything if any item fails),
+                save_path (.3dm file in the temp or a shard folder; relative
+                paths go to the temp folder) and delete_after_save (bool, remove the objects once saved)
+
+        Returns:
+            dict: Result with status, created GUIDs, per-item errors and timing
+                (plus the bounding box of the batch in summary result mode).
+                If the batch fails with an exception, objects created so far
+                are rolled back (atomic), deleted (delete_after_save) or
+                listed in geometry_ids.
+        """
+        doc = Rhino.RhinoDoc.ActiveDoc
+        atomic = params.get('atomic', False)
+        save_path = params.get('save_path')
+        if save_path:
+            # Refuse a forbidden path before anything is created
+            try:
+                save_path = checked_file_path(save_path, self.server.rhino_server.file_dirs)
+            except ValueError as e:
+                return {'status': 'error', 'message': str(e)}
+        # Bounds are only worth accumulating when they will be reported
+        track_bounds = self.result_mode == 'summary'
+        bounds = None
+        creators = {'box': self.create_box, 'sphere': self.create_sphere}
+        geometry_ids = []
+        errors = []
+        # Per-transaction rollback list, only kept in atomic mode
+        created = System.Collections.Generic.List[System.Guid]() if atomic else None
+        start = time.time()
+
+        undo_record = doc.BeginUndoRecord('MCP create_batch')
+        try:
+            for index, item in enumerate(params.get('items', [])):
+                creator = creators.get(item.get('type', 'box'))
+                if creator is None:
+                    item_result = {
+                        'status': 'error',
+                        'message': 'Unknown type: ' + str(item.get('type'))
+                    }
+                else:
+                    item_result = creator(item, redraw=False, with_guid=atomic)
+
+                if item_result['status'] == 'success':
+                    geometry_ids.append(item_result['geometry_id'])
+                    if atomic:
+                        # The Guid from Rhino, not re-parsed from its string
+                        created.Add(item_result['_guid'])
+                    if track_bounds:
+                        item_bounds = result_bounds(item_result)
+                        bounds = grow_bounds(bounds, item_bounds['min'], item_bounds['max'])
+                else:
+                    errors.append({'index': index, 'message': item_result['message']})
+                    if atomic:
+                        break
+
+            result = {
+                'status': 'success' if not errors else 'error',
+                'atomic': atomic
+            }
+
+            if atomic and errors:
+                rollback_start = time.time()
+                result['rolled_back'] = self.rollback(doc, created)
+                result['rollback_ms'] = round((time.time() - rollback_start) * 1000.0, 3)
+                geometry_ids = []
+                bounds = None
+            else:
+                if save_path:
+                    result['saved_path'] = save_objects(geometry_ids, save_path)
+                    if params.get('delete_after_save', False):
+                        rs.DeleteObjects(geometry_ids)
+
+            result['message'] = 'Created ' + str(len(geometry_ids)) + ' objects'
+            result['geometry_ids'] = geometry_ids
+            result['errors'] = errors
+            if track_bounds:
+                result['bounding_box'] = bounds
+            result['elapsed_ms'] = round((time.time() - start) * 1000.0, 3)
+            return result
+
+        except Exception as e:
+            result = {
+                'status': 'error',
+                'message': 'Failed to create batch: ' + str(e)
+            }
+            if atomic:
+                result['rolled_back'] = self.rollback(doc, created)
+            elif params.get('delete_after_save', False):
+                # Worker run: nobody will import these objects, so remove them
+                result['deleted'] = rs.DeleteObjects(geometry_ids) if geometry_ids else 0
+            else:
+                # The objects stay in the document; report them for clean-up
+                result['geometry_ids'] = geometry_ids
+            return result
+
+        finally:
+            doc.EndUndoRecord(undo_record)
+            rs.Redraw()
+
+    def rollback(self, doc, object_ids):
+        """
+        Delete the objects created by a failed atomic batch in one call
+
+        Args:
+            doc: Rhino.RhinoDoc the batch was created in
+            object_ids: List[Guid] of the objects created so far
+
+        Returns:
+            int: Number of objects deleted
+        """
+        if object_ids.Count == 0:
+            return 0
+        return doc.Objects.Delete(object_ids, True)
+
+    def import_files(self, params):
+        """
+        Merge .3dm files (e.g. partitions saved by worker instances) into the document
+
+        A file that cannot be read does not stop the import: the remaining
+        files are still merged and every failure is listed in errors.
+
+        Args:
+            params (dict): Dictionary with paths (list of .3dm files in the
+                temp or a shard folder) and optional delete_files (bool,
+                remove each file once imported)
+
+        Returns:
+            dict: Result with status, the GUIDs of the imported objects and
+                per-file errors (plus their bounding box in summary result mode)
+        """
+        doc = Rhino.RhinoDoc.ActiveDoc
+        geometry_ids = []
+        errors = []
+        track_bounds = self.result_mode == 'summary'
+        bounds = None
+
+        allowed_dirs = self.server.rhino_server.file_dirs
+
+        for path in params.get('paths', []):
+            try:
+                # Other paths are neither read nor deleted
+                path = checked_file_path(path, allowed_dirs)
+                model = Rhino.FileIO.File3dm.Read(path)
+                if model is None:
+                    errors.append({'path': path, 'message': 'Cannot read file: ' + str(path)})
+                    continue
+                for file_object in model.Objects:
+                    # Attributes are not copied: layer indices belong to the source file
+                    geometry_ids.append(str(doc.Objects.Add(file_object.Geometry)))
+                    if track_bounds:
+                        bbox = file_object.Geometry.GetBoundingBox(True)
+                        bounds = grow_bounds(
+                            bounds,
+                            [bbox.Min.X, bbox.Min.Y, bbox.Min.Z],
+                            [bbox.Max.X, bbox.Max.Y, bbox.Max.Z]
+                        )
+                model.Dispose()
+
+                if params.get('delete_files', False):
+                    os.remove(path)
+
+            except Exception as e:
+                errors.append({
+                    'path': path,
+                    'message': 'Failed to import file: ' + str(e)
+                })
+
+        rs.Redraw()
+
+        result = {
+            'status': 'success' if not errors else 'error',
+            'message': 'Imported ' + str(len(geometry_ids)) + ' objects',
+            'geometry_ids': geometry_ids,
+            'errors': errors
+        }
+        if track_bounds:
+            result['bounding_box'] = bounds
+        return result
+
+    def get_bounding_box(self, params):
+        """
+        Get the bounding box of an existing object (served from the mesh cache)
+
+        Args:
+            params (dict): Dictionary with object_id
+
+        Returns:
+            dict: Result with status, min and max corners
+        """
+        try:
+            rhino_object = rs.coercerhinoobject(params.get('object_id', ''))
+            if rhino_object is None:
+                return {
+                    'status': 'error',
+                    'message': 'Object not found: ' + str(params.get('object_id'))
+                }
+
+            entry, cached = mesh_cache.lookup(rhino_object)
+            bbox = entry['bbox']
+
+            return {
+                'status': 'success',
+                'geometry_id': str(rhino_object.Id),
+                'min': [bbox.Min.X, bbox.Min.Y, bbox.Min.Z],
+                'max': [bbox.Max.X, bbox.Max.Y, bbox.Max.Z],
+                'cached': cached
+            }
+
+        except Exception as e:
+            return {
+                'status': 'error',
+                'message': 'Failed to get bounding box: ' + str(e)
+            }
+
+    def get_mesh(self, params):
+        """
+        Get the tessellated mesh of an existing object (served from the mesh cache)
+
+        Args:
+            params (dict): Dictionary with object_id and optional
+                include_geometry (bool) to return vertex and face lists
+
+        Returns:
+            dict: Result with status, vertex/face counts and optionally geometry
+        """
+        try:
+            rhino_object = rs.coercerhinoobject(params.get('object_id', ''))
+            if rhino_object is None:
+                return {
+                    'status': 'error',
+                    'message': 'Object not found: ' + str(params.get('object_id'))
+                }
+
+            entry, cached = mesh_cache.lookup(rhino_object, with_mesh=True)
+            mesh = entry['mesh']
+
+            result = {
+                'status': 'success',
+                'geometry_id': str(rhino_object.Id),
+                'vertex_count': mesh.Vertices.Count,
+                'face_count': mesh.Faces.Count,
+                'cached': cached
+            }
+
+            if params.get('include_geometry', False):
+                result['vertices'] = [[v.X, v.Y, v.Z] for v in mesh.Vertices]
+                result['faces'] = [
+                    [f.A, f.B, f.C, f.D] if f.IsQuad else [f.A, f.B, f.C]
+                    for f in mesh.Faces
+                ]
+
+            return result
+
+        except Exception as e:
+            return {
+                'status': 'error',
+                'message': 'Failed to get mesh: ' + str(e)
+            }
+
+    def send_json_response(self, data, status_code=200, result_mode=None, headers=None):
+        """Send JSON response back to client, recording size and serialise time"""
+        start = time.time()
+        body = json.dumps(data)
+        serialize_ms = (time.time() - start) * 1000.0
+        if result_mode in RESULT_MODES:
+            response_stats.record(result_mode, len(body), serialize_ms)
+
         self.send_response(status_code)
         self.send_header('Content-type', 'application/json')
         self.send_header('Access-Control-Allow-Origin', '*')  # For CORS
+        self.send_header('X-Serialize-Ms', '%.3f' % serialize_ms)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
         self.end_headers()
-        self.wfile.write(json.dumps(data))
+        self.wfile.write(body.encode('utf-8'))
 
     def log_message(self, format, *args):
         """Custom logging to Rhino console"""
-        print("HTTP: " + format % args)
+        if self.server.rhino_server.verbosity >= VERBOSE:
+            print("HTTP: " + format % args)
+
+
+class ThreadedHTTPServer(SocketServer.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    """
+    HTTP server that accepts each connection on its own thread
+
+    Requests are admitted or rejected as soon as they arrive instead of
+    queueing unseen in the socket backlog; document work itself is still
+    serialised by document_lock.
+    """
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        """Print errors outside do_POST (e.g. a client that hung up) unless QUIET"""
+        if self.rhino_server.verbosity >= NORMAL:
+            SocketServer.BaseServer.handle_error(self, request, client_address)
 
 
-def run_server(port=8080):
+class RhinoServer(object):
     """
-    Run the HTTP server in a separate thread
+    Configurable Rhino HTTP server, serving on a background thread
     This keeps Rhino's UI responsive!
 
+    Nothing is bound or imported until start() is called.
+
     Args:
-        port (int): Port number to listen on
-    """
-    global server_running
-    try:
-        server = BaseHTTPServer.HTTPServer(('0.0.0.0', port), RhinoGeometryHandler)
-        print(" Server thread started successfully!")
-        print("   Rhino UI will remain responsive")
-        print("")
-
-        # Serve requests until server_running is False
-        while server_running:
-            server.handle_request()  # Handle one request at a time
-
-    except Exception as e:
-        print("\n ERROR: " + str(e))
-        print(traceback.format_exc())
-
-
-# Start the server
-print("\n" + "=" * 70)
-print("  RHINO HTTP SERVER FOR MCP (Non-Blocking)")
-print("=" * 70)
-print("Status: Starting server...")
-print("Listening on: http://0.0.0.0:8080 (accessible from WSL2)")
-print("\nAvailable commands:")
-print("  - create_box: Creates a box with specified dimensions")
-print("  - create_sphere: Creates a sphere with specified radius")
-print("  - ping: Check if server is running")
-print("\n Rhino will stay responsive!")
-print("   You can rotate, zoom, and use Rhino normally")
-print("\nTo stop: Close this Python editor window")
-print("=" * 70 + "\n")
-
-# Create and start server thread
-server_thread = threading.Thread(target=run_server, args=(8080,))
-server_thread.daemon = True  # Thread will stop when script stops
-server_thread.start()
-
-print(" Server is running in background!")
-print("   Waiting for commands from MCP server...")
-print("")
-print("Server status: ACTIVE")
-print("=" * 70)
+        port (int): Port number to listen on (0 picks a free port)
+        host (str): Bind address ('0.0.0.0' is reachable from WSL2)
+        verbosity (int): QUIET, NORMAL or VERBOSE console output
+        features (list): Names from FEATURES to enable (default: all)
+        rate_limiter (RateLimiter): Admission control (default: module settings)
+        shard_dirs (list): Folders besides the temp folder where requests may
+            save, import and delete .3dm files
+    """
+
+    def __init__(self, port=8080, host='0.0.0.0', verbosity=NORMAL,
+                 features=None, rate_limiter=None, shard_dirs=None):
+        self.port = port
+        self.host = host
+        self.verbosity = verbosity
+        self.features = list(features) if features is not None else list(FEATURES)
+        unknown = [feature for feature in self.features if feature not in FEATURES]
+        if unknown:
+            raise ValueError('Unknown features: ' + ', '.join(unknown))
+
+        self.actions = set(['ping'])
+        for feature in self.features:
+            self.actions.update(FEATURES[feature])
+
+        self.rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter()
+        self.file_dirs = [tempfile.gettempdir()] + list(shard_dirs or [])
+        self.running = False
+        self.startup_ms = None
+        self.httpd = None
+        self.thread = None
+        self._rhino_ready = False
+
+    def start(self):
+        """
+        Bind the port and start serving on a daemon thread
+
+        Returns:
+            RhinoServer: self
+        """
+        start = time.time()
+        self.httpd = ThreadedHTTPServer((self.host, self.port), RhinoGeometryHandler)
+        self.httpd.rhino_server = self
+        # Wake up regularly so stop() is noticed without a final request
+        self.httpd.timeout = 0.5
+        self.port = self.httpd.server_address[1]
+
+        self.running = True
+        self.thread = threading.Thread(target=self._serve)
+        self.thread.daemon = True  # Thread will stop when script stops
+        self.thread.start()
+        self.startup_ms = (time.time() - start) * 1000.0
+
+        self._print_banner()
+        return self
+
+    def stop(self):
+        """Stop serving, close the socket and unhook document events"""
+        self.running = False
+        if self.thread is not None:
+            self.thread.join()
+        if self.httpd is not None:
+            self.httpd.server_close()
+        if self._rhino_ready and 'mesh_cache' in self.features:
+            Rhino.RhinoDoc.DeleteRhinoObject -= _on_object_changed
+            Rhino.RhinoDoc.ReplaceRhinoObject -= _on_object_changed
+            Rhino.RhinoDoc.CloseDocument -= _on_document_closed
+        self._rhino_ready = False
+
+    def ensure_rhino(self):
+        """Load the Rhino modules and hook up document events (once, under document_lock)"""
+        if self._rhino_ready:
+            return
+        load_rhino()
+        if 'mesh_cache' in self.features:
+            # Keep the mesh cache in sync with the document
+            Rhino.RhinoDoc.DeleteRhinoObject += _on_object_changed
+            Rhino.RhinoDoc.ReplaceRhinoObject += _on_object_changed
+            Rhino.RhinoDoc.CloseDocument += _on_document_closed
+        self._rhino_ready = True
+
+    def stats(self):
+        """Return the server configuration and startup time as a dict"""
+        return {
+            'host': self.host,
+            'port': self.port,
+            'verbosity': self.verbosity,
+            'features': self.features,
+            'startup_ms': round(self.startup_ms, 3) if self.startup_ms is not None else None
+        }
+
+    def _serve(self):
+        try:
+            # Serve requests until stop() is called
+            while self.running:
+                self.httpd.handle_request()  # Accept one connection at a time
+
+        except Exception as e:
+            if self.verbosity >= NORMAL:
+                print("\n ERROR: " + str(e))
+                print(traceback.format_exc())
+
+    def _print_banner(self):
+        if self.verbosity >= VERBOSE:
+            print("\n" + "=" * 70)
+            print("  RHINO HTTP SERVER FOR MCP (Non-Blocking)")
+            print("=" * 70)
+            print("Listening on: http://" + self.host + ":" + str(self.port))
+            print("Features: " + ", ".join(self.features))
+            print("\nAvailable commands:")
+            for action, description in ACTION_HELP.items():
+                if action in self.actions:
+                    print("  - " + action + ": " + description)
+            print("  Any command may set result_mode: full (default), ids or summary")
+            print("\n Rhino will stay responsive!")
+            print("   You can rotate, zoom, and use Rhino normally")
+            print("\nTo stop: Close this Python editor window")
+            print("=" * 70 + "\n")
+        elif self.verbosity >= NORMAL:
+            print(" Rhino HTTP server running on http://" + self.host + ":" + str(self.port))
+            print("   Rhino will stay responsive. To stop: Close this Python editor window")
+
+
+# Start the server when the script is run (not when imported)
+if __name__ == '__main__':
+    server = RhinoServer(port=8080, host='0.0.0.0', verbosity=NORMAL)
+    server.start()
@@ -11,14 +11,28 @@ INSTRUCTIONS FOR USE:
 3. Run: python rhino_mcp_server.py
 4. The server will wait for MCP protocol messages from Claude
 
+MULTIPLE RHINO INSTANCES:
+Set RHINO_INSTANCES to a comma-separated list of name=url pairs, e.g.
+    RHINO_INSTANCES="main=http://host:8080,farm1=http://host:8081"
+The first entry is the primary instance. Single-object tools (create_box,
+get_bounding_box, ...) use the primary instance unless an instance name is
+given, so returned GUIDs can be read back with the same defaults. Batch
+tools spread their work over the least-loaded instances and report which
+instance holds which GUIDs.
+
 Author: Olaf Olden
 Date: 2025-11-22
 """
 
 import requests
 from fastmcp import FastMCP
+from concurrent.futures import ThreadPoolExecutor
 import json
 import os
+import random
+import threading
+import time
+import uuid
 
 # Initialize MCP server
 mcp = FastMCP(name="Rhino Active Instance")
@@ -38,14 +52,208 @@ def get_rhino_url():
 
 RHINO_URL = get_rhino_url()
 
+# Connections kept open per Rhino instance
+POOL_SIZE = int(os.environ.get("RHINO_POOL_SIZE", "4"))
+
+# Requests that Rhino rejects with 429 (rate limited) are retried until the
+# call's timeout runs out, waiting the server's Retry-After plus jitter
+# (exponential backoff if the server sends none)
+BACKOFF_BASE = 0.25
+BACKOFF_MAX = 5.0
+
+# Objects per create_batch request when a batch is fanned out. Sized to the
+# Rhino server's create_batch rate limit (10/s, burst 20), which then allows
+# 10000 objects/s per client
+BATCH_CHUNK_SIZE = 1000
+
+# Folder where worker instances save scene partitions (must be readable by
+# the primary instance, and listed in every Rhino server's shard_dirs, which
+# only allow files in the temp and shard folders). Empty: each worker uses its
+# own temp folder, which works when all instances run on the same machine.
+SHARD_DIR = os.environ.get("RHINO_SHARD_DIR", "")
+
+
+class RhinoInstance:
+    """
+    A named Rhino HTTP server with its own pooled connection
+
+    Tracks requests in flight (queue depth) and a moving average of the
+    request latency so work can be routed to the least-loaded instance.
+    """
+
+    def __init__(self, name, url, pool_size=POOL_SIZE):
+        self.name = name
+        self.url = url
+        self.pool_size = pool_size
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=pool_size
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self.in_flight = 0
+        self.requests = 0
+        self.errors = 0
+        self.throttled = 0
+        # No new requests before this time (set from the server's Retry-After):
+        # for every action after a 'busy' 429 (in-flight cap), per action
+        # after a 'rate' 429 (the server limits each client and action)
+        self.resume_at = 0.0
+        self.action_resume_at = {}
+        self.avg_latency_ms = None
+        self._lock = threading.Lock()
+
+    def post(self, payload, timeout=10):
+        """Send a JSON payload to this instance, recording latency and queue depth"""
+        with self._lock:
+            self.in_flight += 1
+        start = time.perf_counter()
+        try:
+            return self.session.post(
+                self.url,
+                json=payload,
+                timeout=timeout,
+                headers={"Content-Type": "application/json"}
+            )
+        except Exception:
+            with self._lock:
+                self.errors += 1
+            raise
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000.0
+            with self._lock:
+                self.in_flight -= 1
+                self.requests += 1
+                if self.avg_latency_ms is None:
+                    self.avg_latency_ms = elapsed_ms
+                else:
+                    # Exponential moving average, recent requests weigh most
+                    self.avg_latency_ms = 0.8 * self.avg_latency_ms + 0.2 * elapsed_ms
+
+    def record_throttled(self, retry_after, action=None):
+        """
+        Count a request rejected by the server's admission control and pause
+        requests to this instance for retry_after seconds
+
+        Args:
+            retry_after (float): Seconds from the server's Retry-After
+            action (str): Pause only this action (rate limit), or None to
+                pause every action (in-flight cap)
+        """
+        with self._lock:
+            self.throttled += 1
+            resume_at = time.monotonic() + retry_after
+            if action is None:
+                self.resume_at = max(self.resume_at, resume_at)
+            else:
+                self.action_resume_at[action] = max(
+                    self.action_resume_at.get(action, 0.0), resume_at
+                )
+
+    def paused_for(self, action=None):
+        """Seconds until this instance accepts the action again after a 429"""
+        with self._lock:
+            resume_at = max(self.resume_at, self.action_resume_at.get(action, 0.0))
+        return max(0.0, resume_at - time.monotonic())
+
+    def wait_for_turn(self, action=None):
+        """Sleep until the instance accepts the action again after a 429"""
+        wait = self.paused_for(action)
+        if wait > 0:
+            time.sleep(wait)
+
+    def load(self, action=None):
+        """
+        Estimated wait for a new request in ms: queue depth times average
+        latency, plus the remaining pause for the action after a 429
+        """
+        paused_ms = self.paused_for(action) * 1000.0
+        with self._lock:
+            return (self.in_flight + 1) * (self.avg_latency_ms or 1.0) + paused_ms
+
+    def stats(self):
+        """Return latency and queue statistics as a dict"""
+        with self._lock:
+            return {
+                "name": self.name,
+                "url": self.url,
+                "pool_size": self.pool_size,
+                "in_flight": self.in_flight,
+                "requests": self.requests,
+                "errors": self.errors,
+                "throttled": self.throttled,
+                "avg_latency_ms": (
+                    round(self.avg_latency_ms, 2)
+                    if self.avg_latency_ms is not None else None
+                )
+            }
+
+
+def load_instances():
+    """
+    Build the registry of Rhino instances
+
+    RHINO_INSTANCES can list several named endpoints, e.g.
+    "main=http://host:8080,farm1=http://host:8081". Without it a single
+    instance named "default" at RHINO_URL is used.
+
+    Returns:
+        dict: Instance name -> RhinoInstance (first entry is the primary)
+    """
+    spec = os.environ.get("RHINO_INSTANCES", "").strip()
+    if not spec:
+        return {"default": RhinoInstance("default", RHINO_URL)}
+
+    instances = {}
+    for entry in spec.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        name, _, url = entry.partition("=")
+        if not url:
+            raise ValueError(f"Invalid RHINO_INSTANCES entry (expected name=url): {entry}")
+        instances[name.strip()] = RhinoInstance(name.strip(), url.strip())
+    return instances
 
-def call_rhino(action, params=None):
+
+INSTANCES = load_instances()
+PRIMARY_INSTANCE = next(iter(INSTANCES))
+
+# Shared worker threads for fanning batch work out across instances
+executor = ThreadPoolExecutor(max_workers=sum(i.pool_size for i in INSTANCES.values()))
+
+
+def get_instance(name=None, action=None):
+    """
+    Resolve an instance by name, or pick the least-loaded one
+
+    Args:
+        name (str): Instance name, or None/"" for the least-loaded instance
+        action (str): Action to be sent (instances throttled for it count
+            as loaded)
+
+    Returns:
+        RhinoInstance: The selected instance
+    """
+    if name:
+        return INSTANCES[name]
+    return min(INSTANCES.values(), key=lambda instance: instance.load(action))
+
+
+def call_rhino(action, params=None, instance=None, timeout=10, result_mode="full"):
     """
     Send a command to the Rhino HTTP server
 
     Args:
         action (str): Action name (e.g., 'create_box')
         params (dict): Parameters for the action
+        instance (str): Instance name, or None for the least-loaded instance
+            (picked again for every retry)
+        timeout (float): Seconds to wait for the response
+        result_mode (str): "full", "ids" (GUIDs only) or "summary"
+            (count, bounding box and errors)
 
     Returns:
         dict: Response from Rhino server
@@ -57,49 +265,315 @@ def call_rhino(action, params=None):
         "action": action,
         "params": params
     }
+    if result_mode != "full":
+        payload["result_mode"] = result_mode
 
     try:
-        response = requests.post(
-            RHINO_URL,
-            json=payload,
-            timeout=10,
-            headers={"Content-Type": "application/json"}
-        )
+        target = get_instance(instance, action)
+    except KeyError:
+        return {
+            "status": "error",
+            "message": f"Unknown Rhino instance: {instance}"
+        }
+
+    try:
+        # 429s are retried until the timeout budget is spent
+        deadline = time.monotonic() + timeout
+        attempt = 0
+        while True:
+            target.wait_for_turn(action)
+            response = target.post(payload, timeout=timeout)
+            if response.status_code != 429:
+                break
+            retry_after, delay, limit = retry_delay(response, attempt)
+            if time.monotonic() + delay > deadline:
+                break
+            # Only the in-flight cap blocks other actions on the instance
+            target.record_throttled(retry_after, None if limit == "busy" else action)
+            attempt += 1
+            throttled = target
+            if not instance:
+                # An unpinned call moves on if another instance is free
+                target = get_instance(action=action)
+            if target is throttled:
+                time.sleep(delay)
 
         if response.status_code == 200:
-            return response.json()
+            result = response.json()
+            # Lets callers route follow-up requests to the same document
+            result.setdefault("instance", target.name)
+            return result
         else:
             return {
                 "status": "error",
-                "message": f"HTTP {response.status_code}: {response.text}"
+                "message": f"HTTP {response.status_code}: {response.text}",
+                "instance": target.name
             }
 
     except requests.exceptions.ConnectionError:
         return {
             "status": "error",
-            "message": "Cannot connect to Rhino. Is the HTTP server running?"
+            "message": f"Cannot connect to Rhino ({target.name}). Is the HTTP server running?",
+            "instance": target.name
         }
     except Exception as e:
         return {
             "status": "error",
-            "message": f"Error: {str(e)}"
+            "message": f"Error: {str(e)}",
+            "instance": target.name
         }
 
 
+def retry_delay(response, attempt):
+    """
+    Seconds to wait before retrying a rate-limited (429) request
+
+    Args:
+        response: The 429 response
+        attempt (int): Number of the attempt that was rejected (0-based)
+
+    Returns:
+        tuple: (server's Retry-After in seconds, backoff delay, limit hit:
+            "rate", "busy" or None if the server does not say); the delay is
+            Retry-After (or exponential backoff without one) plus jitter so
+            that throttled clients do not retry in lockstep
+    """
+    try:
+        body = response.json()
+    except ValueError:
+        body = {}
+    limit = body.get("limit")
+    try:
+        retry_after = float(body.get("retry_after"))
+    except (TypeError, ValueError):
+        try:
+            retry_after = float(response.headers.get("Retry-After", 0))
+        except ValueError:
+            retry_after = 0.0
+
+    if retry_after > 0:
+        delay = retry_after
+    else:
+        # No hint from the server: exponential backoff
+        delay = min(BACKOFF_MAX, BACKOFF_BASE * (2 ** min(attempt, 10)))
+    return retry_after, delay * random.uniform(1.0, 1.5), limit
+
+
+def call_rhino_many(calls, instance=None, timeout=10, result_mode="full"):
+    """
+    Send several commands in parallel, spread over the registered instances
+
+    Each call is routed when a worker thread picks it up, so it goes to
+    whichever instance is least loaded at that moment.
+
+    Args:
+        calls (list): (action, params) tuples
+        instance (str): Pin every call to one instance instead
+        timeout (float): Seconds to wait for each response
+        result_mode (str): Result mode for every call (see call_rhino)
+
+    Returns:
+        list: Responses in the same order as calls
+    """
+    futures = [
+        executor.submit(call_rhino, action, params, instance, timeout, result_mode)
+        for action, params in calls
+    ]
+    return [future.result() for future in futures]
+
+
+def partition_items(items, count, mode="spatial"):
+    """
+    Split a batch of geometry items into partitions
+
+    Args:
+        items (list): Item dicts with x, y, z coordinates
+        count (int): Number of partitions
+        mode (str): "spatial" sorts along the axis with the largest extent so
+            each partition covers one slab of the scene; "count" keeps the
+            original order
+
+    Returns:
+        list: Non-empty lists of (index, item) tuples, sizes differing by at most one
+    """
+    indexed = list(enumerate(items))
+    if mode == "spatial" and indexed:
+        extents = []
+        for axis in ("x", "y", "z"):
+            values = [item.get(axis, 0.0) for item in items]
+            extents.append((max(values) - min(values), axis))
+        axis = max(extents)[1]
+        indexed.sort(key=lambda pair: pair[1].get(axis, 0.0))
+    elif mode != "count":
+        raise ValueError(f"Unknown partition mode: {mode}")
+
+    size, remainder = divmod(len(indexed), count)
+    partitions = []
+    start = 0
+    for number in range(count):
+        end = start + size + (1 if number < remainder else 0)
+        if end > start:
+            partitions.append(indexed[start:end])
+        start = end
+    return partitions
+
+
+def result_count(result):
+    """Number of objects in a create/import result, in any result mode"""
+    return result.get("count", len(result.get("geometry_ids", [])))
+
+
+def merge_bounds(bounds, other):
+    """Union of two {"min": [...], "max": [...]} bounding boxes (either may be None)"""
+    if bounds is None or other is None:
+        return bounds or other
+    return {
+        "min": [min(a, b) for a, b in zip(bounds["min"], other["min"])],
+        "max": [max(a, b) for a, b in zip(bounds["max"], other["max"])]
+    }
+
+
+def format_bounds(bounds):
+    """One-line description of a bounding box for tool output"""
+    bb_min = bounds["min"]
+    bb_max = bounds["max"]
+    return (
+        f"Bounds: ({bb_min[0]}, {bb_min[1]}, {bb_min[2]}) - "
+        f"({bb_max[0]}, {bb_max[1]}, {bb_max[2]})"
+    )
+
+
+def scatter_gather(items, mode="spatial", shard_dir=SHARD_DIR, result_mode="summary"):
+    """
+    Generate a large scene in parallel on the worker instances
+
+    The batch is partitioned, each partition is created by one worker and
+    saved to a .3dm file, and the primary instance merges the files with
+    import_files. All non-primary instances are workers; with a single
+    instance the primary does all the work directly.
+
+    Args:
+        items (list): Item dicts for create_batch ('type' plus params)
+        mode (str): Partition mode, "spatial" or "count"
+        shard_dir (str): Folder for partition files (see RHINO_SHARD_DIR)
+        result_mode (str): Result mode of the objects in the primary document;
+            workers always answer in summary mode
+
+    Returns:
+        dict: status, created (count), errors, per-worker counts and either
+            geometry_ids or (summary mode) bounding_box
+    """
+    workers = [name for name in INSTANCES if name != PRIMARY_INSTANCE] or [PRIMARY_INSTANCE]
+    partitions = partition_items(items, len(workers), mode)
+    job = uuid.uuid4().hex[:8]
+    separator = "\\" if "\\" in shard_dir else "/"
+
+    futures = []
+    for number, (worker, partition) in enumerate(zip(workers, partitions)):
+        params = {"items": [item for _, item in partition]}
+        if worker != PRIMARY_INSTANCE:
+            filename = f"rhino_shard_{job}_{number}.3dm"
+            params["save_path"] = (
+                shard_dir.rstrip("\\/") + separator + filename if shard_dir else filename
+            )
+            params["delete_after_save"] = True
+            # Worker GUIDs are gone after saving, only the count matters
+            worker_mode = "summary"
+        else:
+            worker_mode = result_mode
+        futures.append(executor.submit(
+            call_rhino, "create_batch", params, worker, 600, worker_mode
+        ))
+
+    errors = []
+    saved_paths = []
+    geometry_ids = []
+    bounds = None
+    created = 0
+    per_worker = {}
+    for worker, partition, future in zip(workers, partitions, futures):
+        result = future.result()
+        for error in result.get("errors", []):
+            # Map partition-local indices back to the caller's batch
+            errors.append({
+                "index": partition[error["index"]][0],
+                "message": error["message"]
+            })
+        if "saved_path" in result:
+            saved_paths.append(result["saved_path"])
+        elif worker == PRIMARY_INSTANCE:
+            created += result_count(result)
+            geometry_ids.extend(result.get("geometry_ids", []))
+            bounds = merge_bounds(bounds, result.get("bounding_box"))
+        if result.get("status") != "success" and not result.get("errors"):
+            message = result.get("message", "Unknown error")
+            if "deleted" in result:
+                # The worker removed its partial partition again
+                message += f" ({result['deleted']} created objects deleted)"
+            errors.append({"worker": worker, "message": message})
+        per_worker[worker] = result_count(result)
+
+    if saved_paths:
+        merged = call_rhino(
+            "import_files",
+            {"paths": saved_paths, "delete_files": True},
+            PRIMARY_INSTANCE,
+            600,
+            result_mode
+        )
+        # Files that were read are merged even if others failed
+        created += result_count(merged)
+        geometry_ids.extend(merged.get("geometry_ids", []))
+        bounds = merge_bounds(bounds, merged.get("bounding_box"))
+        for error in merged.get("errors", []):
+            errors.append({"worker": PRIMARY_INSTANCE, "message": error["message"]})
+        if merged.get("status") != "success" and not merged.get("errors"):
+            errors.append({"worker": PRIMARY_INSTANCE, "message": merged.get("message", "Unknown error")})
+
+    result = {
+        "status": "success" if not errors else "error",
+        "created": created,
+        "errors": errors,
+        "per_worker": per_worker
+    }
+    if result_mode == "summary":
+        result["bounding_box"] = bounds
+    else:
+        result["geometry_ids"] = geometry_ids
+    return result
+
+
+def instance_suffix(result):
+    """Instance line for tool output, only when several instances are registered"""
+    if len(INSTANCES) > 1 and result.get("instance"):
+        return f"\nInstance: {result['instance']}"
+    return ""
+
+
 @mcp.tool()
-def ping_rhino() -> str:
+def ping_rhino(instance: str = "") -> str:
     """
     Check if Rhino HTTP server is running and responsive.
 
+    Args:
+        instance: Rhino instance to ping (default: all registered instances)
+
     Returns:
         str: Status message
     """
-    result = call_rhino("ping")
+    names = [instance] if instance else list(INSTANCES)
+    futures = [executor.submit(call_rhino, "ping", {}, name) for name in names]
+    results = [future.result() for future in futures]
+    lines = []
+
+    for name, result in zip(names, results):
+        label = f" ({name})" if len(INSTANCES) > 1 else ""
+        if result.get("status") == "ok":
+            lines.append(f" Rhino{label} is running and ready!")
+        else:
+            lines.append(f" Error{label}: {result.get('message', 'Unknown error')}")
 
-    if result.get("status") == "ok":
-        return " Rhino is running and ready!"
-    else:
-        return f" Error: {result.get('message', 'Unknown error')}"
+    return "\n".join(lines)
 
 
 @mcp.tool()
@@ -109,7 +583,8 @@ def create_box(
     z: float = 0.0,
     width: float = 10.0,
     height: float = 10.0,
-    depth: float = 10.0
+    depth: float = 10.0,
+    instance: str = ""
 ) -> str:
     """
     Create a box in the active Rhino document.
@@ -121,6 +596,7 @@ def create_box(
         width: Width of box in X direction (default: 10)
         height: Height of box in Y direction (default: 10)
         depth: Depth of box in Z direction (default: 10)
+        instance: Rhino instance to use (default: primary instance)
 
     Returns:
         str: Confirmation message with geometry details
@@ -134,7 +610,7 @@ def create_box(
         "depth": depth
     }
 
-    result = call_rhino("create_box", params)
+    result = call_rhino("create_box", params, instance or PRIMARY_INSTANCE)
 
     if result.get("status") == "success":
         pos = result.get("position", [x, y, z])
@@ -142,7 +618,9 @@ def create_box(
         return (
             f" Box created in Rhino!\n"
             f"Position: ({pos[0]}, {pos[1]}, {pos[2]})\n"
-            f"Dimensions: {dims[0]} × {dims[1]} × {dims[2]}"
+            f"Dimensions: {dims[0]} × {dims[1]} × {dims[2]}\n"
+            f"ID: {result.get('geometry_id')}"
+            f"{instance_suffix(result)}"
         )
     else:
         return f" Error: {result.get('message', 'Unknown error')}"
@@ -153,7 +631,8 @@ def create_sphere(
     x: float = 0.0,
     y: float = 0.0,
     z: float = 0.0,
-    radius: float = 5.0
+    radius: float = 5.0,
+    instance: str = ""
 ) -> str:
     """
     Create a sphere in the active Rhino document.
@@ -163,6 +642,7 @@ def create_sphere(
         y: Y coordinate of center (default: 0)
         z: Z coordinate of center (default: 0)
         radius: Radius of sphere (default: 5)
+        instance: Rhino instance to use (default: primary instance)
 
     Returns:
         str: Confirmation message with geometry details
@@ -174,7 +654,7 @@ def create_sphere(
         "radius": radius
     }
 
-    result = call_rhino("create_sphere", params)
+    result = call_rhino("create_sphere", params, instance or PRIMARY_INSTANCE)
 
     if result.get("status") == "success":
         center = result.get("center", [x, y, z])
@@ -182,12 +662,250 @@ def create_sphere(
         return (
             f" Sphere created in Rhino!\n"
             f"Center: ({center[0]}, {center[1]}, {center[2]})\n"
-            f"Radius: {r}"
+            f"Radius: {r}\n"
+            f"ID: {result.get('geometry_id')}"
+            f"{instance_suffix(result)}"
+        )
+    else:
+        return f" Error: {result.get('message', 'Unknown error')}"
+
+
+@mcp.tool()
+def get_bounding_box(object_id: str, instance: str = "") -> str:
+    """
+    Get the bounding box of an existing object in the active Rhino document.
+
+    Repeated queries on unchanged objects are served from Rhino's mesh cache.
+
+    Args:
+        object_id: GUID of the object (as returned by create_box/create_sphere)
+        instance: Rhino instance holding the object (default: primary instance)
+
+    Returns:
+        str: Bounding box corners
+    """
+    result = call_rhino(
+        "get_bounding_box",
+        {"object_id": object_id},
+        instance or PRIMARY_INSTANCE
+    )
+
+    if result.get("status") == "success":
+        bb_min = result.get("min")
+        bb_max = result.get("max")
+        return (
+            f" Bounding box of {result.get('geometry_id')}\n"
+            f"Min: ({bb_min[0]}, {bb_min[1]}, {bb_min[2]})\n"
+            f"Max: ({bb_max[0]}, {bb_max[1]}, {bb_max[2]})"
         )
     else:
         return f" Error: {result.get('message', 'Unknown error')}"
 
 
+@mcp.tool()
+def mesh_cache_stats(instance: str = "") -> str:
+    """
+    Show hit-rate and memory statistics of Rhino's mesh cache.
+
+    Args:
+        instance: Rhino instance to query (default: primary instance)
+
+    Returns:
+        str: Cache statistics
+    """
+    result = call_rhino("mesh_cache_stats", instance=instance or PRIMARY_INSTANCE)
+
+    if result.get("status") == "success":
+        stats = result.get("stats", {})
+        return (
+            f" Mesh cache: {stats.get('entries')} entries, "
+            f"{stats.get('bytes')} / {stats.get('max_bytes')} bytes\n"
+            f"Hits: {stats.get('hits')}, misses: {stats.get('misses')}, "
+            f"hit rate: {stats.get('hit_rate')}\n"
+            f"Evictions: {stats.get('evictions')}, "
+            f"invalidations: {stats.get('invalidations')}"
+        )
+    else:
+        return f" Error: {result.get('message', 'Unknown error')}"
+
+
+@mcp.tool()
+def create_boxes(
+    boxes: list[dict],
+    instance: str = "",
+    atomic: bool = False,
+    result_mode: str = "summary"
+) -> str:
+    """
+    Create many boxes at once, spread in parallel over the Rhino instances.
+
+    Args:
+        boxes: List of boxes, each a dict with x, y, z, width, height, depth
+            (missing keys use the create_box defaults)
+        instance: Pin the whole batch to one Rhino instance
+            (default: chunks go to the least-loaded instances)
+        atomic: All-or-nothing: if any box fails, every box of the batch is
+            removed again. The batch is then sent to a single instance.
+            (default: False)
+        result_mode: "summary" (counts, bounding box, errors), "ids" (also
+            list every GUID) or "full" (default: summary)
+
+    Returns:
+        str: Number of boxes created per instance and any errors
+    """
+    items = [dict(box, type="box") for box in boxes]
+
+    if atomic:
+        # Rollback only works inside one document, so no fan-out
+        offsets = [0]
+        results = [call_rhino(
+            "create_batch",
+            {"items": items, "atomic": True},
+            instance or None,
+            600,
+            result_mode
+        )]
+    else:
+        offsets = list(range(0, len(items), BATCH_CHUNK_SIZE))
+        results = call_rhino_many(
+            [
+                ("create_batch", {"items": items[offset:offset + BATCH_CHUNK_SIZE]})
+                for offset in offsets
+            ],
+            instance or None,
+            600,
+            result_mode
+        )
+
+    created = {}
+    errors = []
+    geometry_ids = {}
+    bounds = None
+    rolled_back = 0
+    for offset, result in zip(offsets, results):
+        name = result.get("instance", PRIMARY_INSTANCE)
+        created[name] = created.get(name, 0) + result_count(result)
+        geometry_ids.setdefault(name, []).extend(result.get("geometry_ids", []))
+        bounds = merge_bounds(bounds, result.get("bounding_box"))
+        rolled_back += result.get("rolled_back", 0)
+        for error in result.get("errors", []):
+            errors.append(f"Box {offset + error['index']}: {error['message']}")
+        if result.get("status") != "success" and not result.get("errors"):
+            errors.append(result.get("message", "Unknown error"))
+
+    lines = [f" Created {sum(created.values())} of {len(boxes)} boxes"]
+    for name, count in created.items():
+        lines.append(f"  {name}: {count}")
+    if bounds:
+        lines.append(f" {format_bounds(bounds)}")
+    for name, ids in geometry_ids.items():
+        if ids:
+            # Read-back tools need the instance that holds the GUIDs
+            lines.append(f" IDs ({name}): {', '.join(ids)}")
+    if rolled_back:
+        lines.append(f" Rolled back {rolled_back} boxes (atomic batch failed)")
+    lines.extend(f" Error: {error}" for error in errors)
+    return "\n".join(lines)
+
+
+@mcp.tool()
+def generate_scene_sharded(
+    items: list[dict],
+    partition: str = "spatial",
+    shard_dir: str = "",
+    result_mode: str = "summary"
+) -> str:
+    """
+    Generate a large scene in parallel across the Rhino worker instances.
+
+    The items are split into one partition per worker instance, created in
+    parallel, and merged into the primary instance's document.
+
+    Args:
+        items: Objects to create, each a dict with "type" ("box" or "sphere")
+            and that shape's parameters (x, y, z, width/height/depth or radius)
+        partition: "spatial" (split the scene into slabs) or "count"
+            (split in list order) (default: spatial)
+        shard_dir: Folder for the partition files, shared by all instances
+            (default: RHINO_SHARD_DIR or each worker's temp folder)
+        result_mode: "summary" (counts, bounding box, errors), "ids" (also
+            list every GUID) or "full" (default: summary)
+
+    Returns:
+        str: Number of objects created per worker and any errors
+    """
+    try:
+        result = scatter_gather(items, partition, shard_dir or SHARD_DIR, result_mode)
+    except ValueError as e:
+        return f" Error: {e}"
+
+    lines = [f" Created {result['created']} of {len(items)} objects in {PRIMARY_INSTANCE}"]
+    for worker, count in result["per_worker"].items():
+        lines.append(f"  {worker}: {count}")
+    if result.get("bounding_box"):
+        lines.append(f" {format_bounds(result['bounding_box'])}")
+    if result.get("geometry_ids"):
+        lines.append(f" IDs: {', '.join(result['geometry_ids'])}")
+    for error in result["errors"]:
+        where = f"Item {error['index']}" if "index" in error else error["worker"]
+        lines.append(f" Error: {where}: {error['message']}")
+    return "\n".join(lines)
+
+
+@mcp.tool()
+def list_rhino_instances() -> str:
+    """
+    List the registered Rhino instances with their latency and queue depth.
+
+    Returns:
+        str: One line per instance
+    """
+    lines = []
+    for instance in INSTANCES.values():
+        stats = instance.stats()
+        latency = stats["avg_latency_ms"]
+        primary = " (primary)" if instance.name == PRIMARY_INSTANCE else ""
+        lines.append(
+            f" {stats['name']}{primary}: {stats['url']}\n"
+            f"   in flight: {stats['in_flight']}, requests: {stats['requests']}, "
+            f"errors: {stats['errors']}, throttled: {stats['throttled']}, "
+            f"avg latency: {f'{latency} ms' if latency is not None else 'n/a'}"
+        )
+    return "\n".join(lines)
+
+
+@mcp.tool()
+def server_stats(instance: str = "") -> str:
+    """
+    Show the Rhino server's rate limit counters and response statistics.
+
+    Args:
+        instance: Rhino instance to query (default: primary instance)
+
+    Returns:
+        str: Admission control and response statistics
+    """
+    result = call_rhino("server_stats", instance=instance or PRIMARY_INSTANCE)
+
+    if result.get("status") != "success":
+        return f" Error: {result.get('message', 'Unknown error')}"
+
+    limits = result["stats"]["limits"]
+    lines = [
+        f" Rate limit: {limits['rate_per_second']}/s per client and action "
+        f"(burst {limits['burst']})",
+        f" In flight: {limits['in_flight']} / {limits['max_in_flight']}",
+        f" Admitted: {limits['admitted']}, rejected (rate): {limits['rejected_rate']}, "
+        f"rejected (busy): {limits['rejected_busy']}, clients: {limits['clients']}"
+    ]
+    for mode, entry in result["stats"]["responses"].items():
+        lines.append(
+            f" Responses ({mode}): {entry['responses']}, avg {entry['avg_bytes']} bytes, "
+            f"avg serialise {entry['avg_serialize_ms']} ms"
+        )
+    return "\n".join(lines)
+
+
 # Run the MCP server
 if __name__ == "__main__":
     mcp.run()